@@ -1,10 +1,23 @@
 import fitz
 import re
 import os
+import functools
+import itertools
+import string
 import csv
 import logging
 import warnings
 import tqdm
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+
+# google-re2가 설치되어 있으면 역추적이 심한 정제 패턴에만 선형 시간 정규식 엔진 사용
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 # fitz 워닝 필터 설정
 warnings.filterwarnings('ignore', category=RuntimeWarning)
@@ -21,10 +34,164 @@ logging.basicConfig(
 # MuPDF 에러 메시지 출력 제어
 fitz.TOOLS.mupdf_display_errors(False)
 
+# 병렬 처리 최대 워커 프로세스 수
+MAX_WORKERS = 6
+
+# 워커 하나당 미리 제출해 둘 파일 수 (완료 후 기록을 기다리는 결과가 메모리에 쌓이는 양을 제한)
+PENDING_PER_WORKER = 2
+
+# 텍스트 추출 플래그 (공백 유지로 글자 붙음 방지, 줄 끝 하이픈으로 분리된 단어는 MuPDF에서 결합)
+TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_DEHYPHENATE
+
+# 결과 CSV 파일 쓰기 버퍼 크기 (1MB 단위로 모아서 기록)
+CSV_BUFFER_SIZE = 1 << 20
+
+# 정제 결과 캐시 크기 및 캐시할 텍스트의 최대 길이
+CLEAN_CACHE_SIZE = 4096
+CLEAN_CACHE_MAX_LENGTH = 4096
+
 class PDFProcessingError(Exception):
     """PDF 처리 중 발생하는 커스텀 예외"""
     pass
 
+# 허용할 문자 (알파벳, 숫자, 기본 문장 부호) - 공백 문자는 별도로 허용
+_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + '&(),.\'";:/-')
+
+class _AllowedCharTable(dict):
+    """허용되지 않는 문자를 삭제하는 str.translate용 테이블 (처음 등장한 문자만 판정 후 저장)"""
+    def __missing__(self, code: int):
+        char = chr(code)
+        value = code if char in _ALLOWED_CHARS or char.isspace() else None
+        self[code] = value
+        return value
+
+_ALLOWED_TABLE = _AllowedCharTable()
+
+# re의 \s와 같은 문자 집합 (re2의 \s는 ASCII 공백 일부만 포함하므로 직접 지정)
+_RE2_SPACE_CLASS = r'\t\n\x0b\f\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}'
+
+# 입력에 따라 역추적이 폭증할 수 있는 정제 패턴 (괄호 안 게으른 매칭, 연속 변수 제거)
+# 일반 텍스트에서는 re가 re2보다 빠르므로 이 패턴들만 re2로 컴파일
+_BACKTRACKING_PATTERNS = frozenset([
+    r'\(\s*(.+?)\s*\)',
+    r'\(\s*[,.]\s*(.*?)\)',
+    r'\(\s+[,.]\s*(.*?)\)',
+    r'\(\s*(.*?)\s*[,.]\s*\)',
+    r'\(\s*(.*?)\s+[,.]\)',
+    r'\b[a-zA-Z](?:[\s,.]+[a-zA-Z])+\b',
+])
+
+def _compile_cleanup_pattern(pattern: str):
+    """역추적이 심한 정제 패턴은 re2가 설치되어 있으면 re2로, 나머지 패턴은 re로 컴파일"""
+    if re2 is not None and pattern in _BACKTRACKING_PATTERNS:
+        # \s를 re와 같은 공백 문자 집합으로 치환 (문자 클래스 안에서는 괄호 없이 삽입)
+        re2_pattern = []
+        in_class = False
+        i = 0
+        while i < len(pattern):
+            token = pattern[i:i + 2] if pattern[i] == '\\' else pattern[i]
+            if token == '\\s':
+                re2_pattern.append(_RE2_SPACE_CLASS if in_class else f'[{_RE2_SPACE_CLASS}]')
+            else:
+                if token == '[':
+                    in_class = True
+                elif token == ']':
+                    in_class = False
+                re2_pattern.append(token)
+            i += len(token)
+        
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(''.join(re2_pattern), options)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+# 텍스트 정리 패턴 (모듈 로드 시 한 번만 컴파일)
+_CLEANUP = [(_compile_cleanup_pattern(pattern), replacement) for pattern, replacement in [
+    (r'([a-zA-Z])-\s*([a-zA-Z])', r'\1\2'),     # 하이픈으로 분리된 단어 결합
+    (r'([a-zA-Z])\s+Ž\s+([a-zA-Z])', r'\1\2'),  # Ž로 분리된 단어 결합
+    
+    # 1. 괄호 처리
+    (r'\(\s*\)', ''),                           # 빈 괄호 제거
+    (r'\(\s*,\s*\)', ''),                       # 쉼표만 있는 괄호 제거
+    (r'\((?:Fig\.|Figre\.|[.,]+)\)', ''),       # 특정 문자열이 있는 괄호 삭제
+    (r'\([.,\s]+\)', ''),                       # 구두점만 있는 괄호 삭제
+    (r'\(\(+([^()]*)\)+\)', r'(\1)'),          # 중첩 괄호 처리
+    (r'\(\s*(.+?)\s*\)', r'(\1)'),             # 일반적인 괄호 처리
+    
+    (r'\(\s*[,.]\s*(.*?)\)', r'(\1)'),            # 괄호 안 시작 부분의 쉼표/마침표 제거
+    (r'\(\s+[,.]\s*(.*?)\)', r'(\1)'),            # 괄호 안 시작 부분의 공백+쉼표/마침표 제거
+    (r'\(\s*(.*?)\s*[,.]\s*\)', r'(\1)'),         # 괄호 안 끝 부분의 쉼표/마침표 제거
+    (r'\(\s*(.*?)\s+[,.]\)', r'(\1)'),             # 괄호 안 끝 부분의 공백+쉼표/마침표 제거
+    
+    # 2. 연속 변수 제거
+    (r'\b[a-zA-Z](?:[\s,.]+[a-zA-Z])+\b', ''), # 연속된 변수 제거
+    
+    # 3. 숫자와 특수문자 처리
+    (r'-(?:\s*-)+', '-'),                       # 연속된 하이픈 처리
+    (r'(\w)\s+\1(?:\s+\1){2,}', ''),           # 반복되는 문자 제거
+    
+    # 4. 구두점 정리
+    (r'([.,])\1+', r'\1'),                      # 연속된 마침표, 연속된 쉼표
+    (r'[.,]{2,}', ','),                         # 2개 이상 연속된 구두점을 쉼표로
+    (r'\s*[.,]+\s*(?=[.,])', ''),              # 다음 구두점 앞의 구두점 제거
+    (r'[.,]+(?=\s*$)', '.'),                    # 문장 끝의 구두점은 마침표로
+    (r'\s+\.', '.'),                            # 마침표 앞 공백 제거
+    (r'(["\'])\1+', r'\1'),                     # 연속된 큰따옴표, 연속된 작은따옴표
+    (r'["\']{2,}', '"'),
+    
+    # 5. 공백 정리 
+    (r'\s+,', ','),                             # 쉼표 앞 공백 제거
+    (r'\s*([,.])\s*(?=[,.!?])', r'\1'),        # 구두점 사이 공백
+    (r',\s+', ', '),                            # 쉼표 뒤 공백 표준화
+    (r'\s+', ' '),                               # 남은 연속 공백 정리
+]]
+
+# 정제 루프에서 바로 호출할 치환 함수 (패턴과 치환 문자열을 미리 묶어 반복마다의 언패킹/속성 조회 제거)
+_CLEANUP_SUBN = [functools.partial(pattern.subn, replacement) for pattern, replacement in _CLEANUP]
+
+# 공백 정리 패턴
+_WS = re.compile(r'\s+')
+_SPACED_DOT = re.compile(r'(\w+)\s+\.\s+(\w+)')
+
+# 전처리 단어 연결 패턴
+# 줄바꿈은 앞뒤에 공백을 둔 하나의 단어처럼 취급 (단어 문자에 \n을 포함하고, 공백은 [^\S\n]으로 지정)
+_WORD_JOIN_PATTERNS = [(re.compile(pattern), replacement) for pattern, replacement in [
+    # Ž 패턴으로 분리된 단어 (마침표 포함/미포함)
+    (r'([\w\n]+)[^\S\n]*Ž[^\S\n]*\.?[^\S\n]*([\w\n]+)', r'\1\2'),
+    # 마침표로 분리된 단어
+    (r'([\w\n]+)[^\S\n]*\.[^\S\n]*\.[^\S\n]*([\w\n]+)', r'\1\2'),
+    # 마침표와 공백으로 잘못 분리된 단어
+    (r'([\w\n]+)[^\S\n]+\.[^\S\n]+([\w\n]+)', r'\1 \2'),
+    # 마침표와 공백으로 잘못 분리된 단어 (소문자로 시작하는 경우)
+    (r'([\w\n]+)[^\S\n]*\.[^\S\n]+([a-z][\w\n]*)', r'\1 \2'),
+]]
+_PUNCT_SPACING = re.compile(r'\s*([,.])\s*')
+
+# 약어 뒤의 마침표는 문장 끝으로 보지 않음 (고정 폭 부정 후방 탐색을 이어 붙여 한 번의 탐색으로 처리)
+_NOT_ABBREVIATION = ''.join(f'(?<!{abbreviation}\\.)' for abbreviation in [
+    r'et al',
+    r'i\.e',
+    r'e\.g',
+    r'Fig',
+    r'Figure',
+    r'Eq',
+    r'Dr',
+    r'Prof',
+])
+
+# 문장 분리 패턴
+_SENT_SPLIT = re.compile(
+    rf'(?<=[.!?]){_NOT_ABBREVIATION}\s*(?=[A-Z0-9])|(?<=[.!?]){_NOT_ABBREVIATION}\n+|(?<=[;:])\s+'
+)
+
+# 유효성 검사에서 특수문자로 집계할 문자
+_SPECIAL_CHARS = '"\'(),&-.'
+_QUOTE_RUN = re.compile(r'"{2,}')
+_ENGLISH_BYTES = string.ascii_letters.encode('ascii')
+
 def remove_unnecessary_elements(text: str) -> str:
     """
     알파벳(대/소문자)과 기본 문장 부호((),.'";:-)만 남기고 나머지 문자를 제거하는 함수
@@ -38,69 +205,46 @@ def remove_unnecessary_elements(text: str) -> str:
     Returns:
         str: 정제된 텍스트
     """
-    # 1. 허용할 문자 패턴 정의
-    allowed_pattern = r'[^a-zA-Z0-9&(),.\'";\s:/-]'
-    
-    # 2. 허용되지 않는 모든 문자 제거
-    cleaned_text = re.sub(allowed_pattern, '', text)
-    
-    cleanup_patterns = [
-        (r'([a-zA-Z])-\s*([a-zA-Z])', r'\1\2'),     # 하이픈으로 분리된 단어 결합
-        (r'([a-zA-Z])\s+Ž\s+([a-zA-Z])', r'\1\2'),  # Ž로 분리된 단어 결합
-        
-        # 1. 괄호 처리
-        (r'\(\s*\)', ''),                           # 빈 괄호 제거
-        (r'\(\s*,\s*\)', ''),                       # 쉼표만 있는 괄호 제거
-        (r'\((?:Fig\.|Figre\.|[.,]+)\)', ''),       # 특정 문자열이 있는 괄호 삭제
-        (r'\([.,\s]+\)', ''),                       # 구두점만 있는 괄호 삭제
-        (r'\(\(+([^()]*)\)+\)', r'(\1)'),          # 중첩 괄호 처리
-        (r'\(\s*(.+?)\s*\)', r'(\1)'),             # 일반적인 괄호 처리
-        
-        (r'\(\s*[,.]\s*(.*?)\)', r'(\1)'),            # 괄호 안 시작 부분의 쉼표/마침표 제거
-        (r'\(\s+[,.]\s*(.*?)\)', r'(\1)'),            # 괄호 안 시작 부분의 공백+쉼표/마침표 제거
-        (r'\(\s*(.*?)\s*[,.]\s*\)', r'(\1)'),         # 괄호 안 끝 부분의 쉼표/마침표 제거
-        (r'\(\s*(.*?)\s+[,.]\)', r'(\1)'),             # 괄호 안 끝 부분의 공백+쉼표/마침표 제거
-        
-        # 2. 연속 변수 제거
-        (r'\b[a-zA-Z](?:[\s,.]+[a-zA-Z])+\b', ''), # 연속된 변수 제거
-        
-        # 3. 숫자와 특수문자 처리
-        (r'-(?:\s*-)+', '-'),                       # 연속된 하이픈 처리
-        (r'(\w)\s+\1(?:\s+\1){2,}', ''),           # 반복되는 문자 제거
-        
-        # 4. 구두점 정리
-        (r'\.{2,}', '.'),                           # 연속된 마침표
-        (r',{2,}', ','),                            # 연속된 쉼표
-        (r'[.,]{2,}', ','),                         # 2개 이상 연속된 구두점을 쉼표로
-        (r'\s*[.,]+\s*(?=[.,])', ''),              # 다음 구두점 앞의 구두점 제거
-        (r'[.,]+(?=\s*$)', '.'),                    # 문장 끝의 구두점은 마침표로
-        (r'\s+\.', '.'),                            # 마침표 앞 공백 제거
-        (r'"{2,}', '"'),                           # 연속된 큰따옴표
-        (r"'{2,}", "'"),                           # 연속된 작은따옴표
-        (r'["\']{2,}', '"'),
-        
-        # 5. 공백 정리 
-        (r'[ \s]{2,}', ' '),                        # 연속된 공백 정리
-        (r'\s+,', ','),                             # 쉼표 앞 공백 제거
-        (r'\s*([,.])\s*(?=[,.!?])', r'\1'),        # 구두점 사이 공백
-        (r',\s+', ', '),                            # 쉼표 뒤 공백 표준화
-        (r'\s+', ' '),                               # 남은 연속 공백 정리
-    ]
+    # 허용되지 않는 모든 문자 제거
+    cleaned_text = text.translate(_ALLOWED_TABLE)
 
-    prev_text = None
-    while prev_text != cleaned_text:
-        prev_text = cleaned_text
-        for pattern, replacement in cleanup_patterns:
-            cleaned_text = re.sub(pattern, replacement, cleaned_text)
+    # 패턴을 순환 적용하고, 모든 패턴이 연속으로 텍스트를 바꾸지 못하면 고정점으로 판단
+    pattern_count = len(_CLEANUP_SUBN)
+    unchanged = 0
+    i = 0
+    while unchanged < pattern_count:
+        new_text, n = _CLEANUP_SUBN[i](cleaned_text)
+        if n and new_text != cleaned_text:
+            cleaned_text = new_text
+            unchanged = 0
+        else:
+            unchanged += 1
+        i = (i + 1) % pattern_count
     return cleaned_text.strip()
 
 def clean_text(text: str) -> str:
-    """텍스트에서 불필요한 공백, 탭, 줄바꿈 등을 제거하는 함수"""
+    """텍스트에서 불필요한 공백, 탭, 줄바꿈 등을 제거하는 함수
+    
+    머리글, 바닥글처럼 반복되는 짧은 텍스트는 정제 결과를 캐시하여 재사용합니다.
+    """
+    if len(text) < CLEAN_CACHE_MAX_LENGTH:
+        return _clean_text_cached(text)
+    return _clean_text(text)
+
+def _clean_text(text: str) -> str:
+    """clean_text의 실제 정제 로직"""
     try:
-        text = re.sub(r'[\t\r\f\v]+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        # 전각 문자, 합자(ﬁ), 특수 공백 등을 일반 문자로 정규화
+        text = unicodedata.normalize('NFKC', text)
+
+        # 허용 문자가 하나도 없으면(한글만 있는 페이지 등) 이후 단계는 문자를 만들지 않으므로 결과는 빈 문자열
+        if not text.translate(_ALLOWED_TABLE).strip():
+            return ""
+
+        # \s는 탭, 줄바꿈 등 모든 공백 문자를 포함하므로 한 번에 정리
+        text = _WS.sub(' ', text)
         
-        text = re.sub(r'(\w+)\s+\.\s+(\w+)', r'\1 \2', text)
+        text = _SPACED_DOT.sub(r'\1 \2', text)
         
         text = remove_unnecessary_elements(text)
         
@@ -109,47 +253,33 @@ def clean_text(text: str) -> str:
         logging.critical(f"텍스트 정제 중 오류 발생: {str(e)}")
         return ""
 
-def split_into_sentences(text: str) -> list:
+_clean_text_cached = functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)(_clean_text)
+
+def split_into_sentences(text: str) -> Iterator[str]:
     """
-    텍스트를 문장 단위로 분리하는 함수
+    텍스트를 문장 단위로 분리하는 제너레이터 함수
     
     Args:
         text (str): 분리할 텍스트
     
-    Returns:
-        list: 분리된 문장 리스트
+    Yields:
+        str: 분리된 문장 (빈 문장 제외)
     """
     if not text:
-        return []
+        return
         
-    # 약어 및 특수 패턴 정의
-    abbreviations = {
-        r'(?<=et al)\.',             
-        r'(?<=i\.e)\.',               
-        r'(?<=e\.g)\.',               
-        r'(?<=Fig)\.',
-        r'(?<=Figure)\.',                 
-        r'(?<=Eq)\.',                 
-        r'(?<=Dr)\.',               
-        r'(?<=Prof)\.',               
-    }
-    
-    # 약어 패턴을 임시 마커로 치환
-    for i, pattern in enumerate(abbreviations):
-        text = re.sub(pattern, f'_DOT_{i}_', text)
-    sentence_patterns = r'(?<=[.!?])\s*(?=[A-Z0-9])|(?<=[.!?])\n+|(?<=[;:])\s+'
-    
-    # 문장 분리 실행
-    sentences = re.split(sentence_patterns, text)
-    
-    # 임시 마커를 다시 마침표로 복원
-    sentences = [
-        re.sub(r'_DOT_\d_', '.', sentence.strip())
-        for sentence in sentences
-    ]
-    
-    # 빈 문장 제거 및 공백 정리
-    return [s.strip() for s in sentences if s.strip()]
+    # 문장 경계를 순서대로 찾으며 분리 (분리 결과 리스트를 만들지 않고 문장 단위로 반환)
+    start = 0
+    for match in _SENT_SPLIT.finditer(text):
+        # 빈 문장 제거
+        sentence = text[start:match.start()].strip()
+        if sentence:
+            yield sentence
+        start = match.end()
+    
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
 
 def write_excluded_doc(writer: csv.DictWriter, doc_id: str, reason: str, error: str = "None"):
     """제외된 문서 정보를 CSV에 기록하는 함수"""
@@ -187,12 +317,33 @@ def get_document_type(pdf_file_path: str) -> str:
 def safe_get_text(page: fitz.Page) -> str:
     """안전하게 페이지 텍스트를 추출하는 함수"""
     try:
-        text = page.get_text(flags=2)
+        text = page.get_text("text", flags=TEXT_FLAGS, sort=False)
         return preprocess_text(text)
     except Exception as e:
         logging.critical(f"텍스트 추출 중 오류 발생: {str(e)}")
         return ""
 
+def count_validity_stats(text: str) -> list[int]:
+    """유효성 검사에 필요한 문자 통계를 계산하는 함수
+    
+    페이지별로 계산한 통계를 더하면 전체 문서의 통계가 됩니다.
+    
+    Returns:
+        list[int]: [전체 문자 수, 특수문자 수, 따옴표 수, 연속된 따옴표 수, 영문 문자 수]
+    """
+    # 특수문자 관련 통계
+    special_chars = sum(text.count(c) for c in _SPECIAL_CHARS)
+    quotes_count = text.count('"')
+    # 따옴표 쌍이 없으면 정규식 탐색 생략, 있으면 리스트 없이 연속 구간 수만 집계
+    consecutive_quotes = sum(1 for _ in _QUOTE_RUN.finditer(text)) if '""' in text else 0
+    
+    # 영문 문자 수
+    # ASCII 부분만 바이트로 변환 후 영문자를 삭제하여 줄어든 길이로 계산 (문자 리스트를 만들지 않음)
+    ascii_bytes = text.encode('ascii', 'ignore')
+    english_chars = len(ascii_bytes) - len(ascii_bytes.translate(None, _ENGLISH_BYTES))
+    
+    return [len(text), special_chars, quotes_count, consecutive_quotes, english_chars]
+
 def check_document_validity(text: str) -> tuple[bool, str]:
     """문서 전체의 유효성을 검사하는 함수
     
@@ -202,20 +353,18 @@ def check_document_validity(text: str) -> tuple[bool, str]:
     # 빈 문서 체크
     if not text.strip():
         return False, "빈 문서"
-        
-    # 기본 통계 계산
-    total_chars = len(text)
+    return check_validity_stats(count_validity_stats(text))
+
+def check_validity_stats(stats: list[int]) -> tuple[bool, str]:
+    """count_validity_stats로 계산한 통계로 문서의 유효성을 검사하는 함수
+    
+    Returns:
+        tuple[bool, str]: (유효성 여부, 제외 이유)
+    """
+    total_chars, special_chars, quotes_count, consecutive_quotes, english_chars = stats
     if total_chars == 0:
         return False, "내용이 없는 문서"
     
-    # 특수문자 관련 통계
-    special_chars = sum(1 for c in text if c in '"\'(),&-.')
-    quotes_count = text.count('"')
-    consecutive_quotes = len(re.findall(r'"{2,}', text))
-    
-    # 영문 문자 수
-    english_chars = len(re.findall(r'[a-zA-Z]', text))
-    
     # 비율 계산
     special_char_ratio = special_chars / total_chars
     meaningful_char_ratio = english_chars / total_chars
@@ -248,16 +397,19 @@ def check_document_validity(text: str) -> tuple[bool, str]:
     return True, ""
 
 
-def process_pdf(pdf_file_path: str, csv_writer: csv.DictWriter, 
-                excluded_writer: csv.DictWriter, min_raw_length: int = 30, min_cleaned_length: int = 20) -> bool:
-    """PDF 파일에서 문장을 추출하여 CSV로 기록
+def process_pdf(pdf_file_path: str, min_raw_length: int = 30,
+                min_cleaned_length: int = 20) -> tuple[str, list[tuple], Optional[tuple[str, str]]]:
+    """PDF 파일에서 문장을 추출하여 CSV에 기록할 행을 반환
+    
+    워커 프로세스에서 실행되므로 CSV 작성기를 직접 사용하지 않고 결과만 반환합니다.
     
     Args:
         pdf_file_path (str): PDF 파일 경로
-        csv_writer (csv.DictWriter): CSV 작성기
-        excluded_writer (csv.DictWriter): 제외된 문서 기록용 CSV 작성기
         min_raw_length (int): 원본 문장의 최소 길이
         min_cleaned_length (int): 정제된 문장의 최소 길이
+    
+    Returns:
+        tuple: (doc_id, CSV 행 리스트, 제외 정보) - 제외 정보는 (제외 이유, 오류) 또는 None
     """
     doc_id = os.path.splitext(os.path.basename(pdf_file_path))[0]
     doc_type = get_document_type(pdf_file_path)
@@ -272,71 +424,76 @@ def process_pdf(pdf_file_path: str, csv_writer: csv.DictWriter,
         except Exception as e:
             raise PDFProcessingError(f"PDF 열기 실패: {str(e)}")
         
-        # 전체 문서 텍스트 추출 및 정제 (유효성 검사용)
-        full_text = ""
-        for page in doc:
-            text = safe_get_text(page)
-            if text:
-                full_text += clean_text(text) + " "
+        # 페이지별 텍스트는 한 번만 추출하여 유효성 검사와 문장 추출에 재사용
+        # (MuPDF 문서 객체는 스레드 간 공유가 안전하지 않으므로 페이지 추출은 순차 처리)
+        page_texts = [safe_get_text(page) for page in doc]
         
         # 문서 유효성 검사
-        is_valid, reason = check_document_validity(full_text)
+        # 전체 텍스트를 결합하지 않고 페이지별 정제 텍스트의 통계를 누적
+        # (페이지 사이를 공백 하나로 구분한 것과 같도록 페이지마다 한 글자씩 더함)
+        stats = [0] * 5
+        has_content = False
+        for text in page_texts:
+            if not text:
+                continue
+            cleaned_page = clean_text(text)
+            if cleaned_page.strip():
+                has_content = True
+            stats = [total + count for total, count in zip(stats, count_validity_stats(cleaned_page))]
+            stats[0] += 1
+        
+        if has_content:
+            is_valid, reason = check_validity_stats(stats)
+        else:
+            is_valid, reason = False, "빈 문서"
         if not is_valid:
-            write_excluded_doc(excluded_writer, doc_id, reason)
             logging.critical(f"제외된 문서: {doc_id} - {reason}")
-            return False
+            return doc_id, [], (reason, "None")
             
-        # 문서가 유효한 경우 문장 추출 및 저장
-        sentences_count = 0
-        for page_no, page in enumerate(doc, 1):
-            text = safe_get_text(page)
-            if not text:
+        # 문서가 유효한 경우 문장 추출
+        rows = []
+        for page_no, text in enumerate(page_texts, 1):
+            # 빈 페이지나 최소 문장 길이보다 짧은 페이지는 추출될 문장이 없으므로 건너뜀
+            if not text or len(text) < min_raw_length:
                 continue
 
             try:
-                original_sentences = split_into_sentences(text)
-                
-                for i, original_sentence in enumerate(original_sentences):
+                for i, original_sentence in enumerate(split_into_sentences(text)):
                     if len(original_sentence) < min_raw_length:
                         continue
                         
+                    # 정제된 문장 생성 및 길이 체크
+                    cleaned_sentence = clean_text(original_sentence)
+                    if not cleaned_sentence or len(cleaned_sentence) < min_cleaned_length:
+                        continue
+                        
+                    # CSV 기록 시 인코딩할 수 없는 문장은 미리 제외 (정제된 문장은 ASCII만 포함)
                     try:
-                        # 정제된 문장 생성 및 길이 체크
-                        cleaned_sentence = clean_text(original_sentence)
-                        if not cleaned_sentence or len(cleaned_sentence) < min_cleaned_length:
-                            continue
-                            
-                        csv_writer.writerow({
-                            'doc_id': doc_id,
-                            'type': doc_type, # paper
-                            'page_no': page_no,
-                            'sentence_no': i + 1,
-                            'original': original_sentence,
-                            'content': cleaned_sentence
-                        })
-                        sentences_count += 1
+                        original_sentence.encode('utf-8')
                     except UnicodeEncodeError:
                         logging.critical(f"인코딩 오류 발생 - doc_id: {doc_id}, page: {page_no}")
                         continue
+                    
+                    # CSV 컬럼 순서: doc_id, type, page_no, sentence_no, original, content
+                    rows.append((doc_id, doc_type, page_no, i + 1, original_sentence, cleaned_sentence))
             except Exception as e:
                 logging.critical(f"문장 처리 오류 - {doc_id}, 페이지 {page_no}: {str(e)}")
                 continue
 
-        if sentences_count == 0:
+        if not rows:
             reason = '추출된 문장이 없음'
-            write_excluded_doc(excluded_writer, doc_id, reason)
             logging.critical(f"제외된 문서: {doc_id} - {reason}")
-            return False
-        return True
+            return doc_id, [], (reason, "None")
+        return doc_id, rows, None
     except PDFProcessingError as e:
-        write_excluded_doc(excluded_writer, doc_id, str(e))
         logging.critical(f"PDF 처리 오류 - {doc_id}: {str(e)}")
-        return False
+        return doc_id, [], (str(e), "None")
     except Exception as e:
-        write_excluded_doc(excluded_writer, doc_id, '처리 중 예상치 못한 오류 발생', str(e))
         logging.critical(f"예상치 못한 오류 - {doc_id}: {str(e)}")
-        return False
+        return doc_id, [], ('처리 중 예상치 못한 오류 발생', str(e))
     finally:
+        # 문서 단위로 정제 캐시 초기화 (메모리 사용량 제한)
+        _clean_text_cached.cache_clear()
         if doc:
             try:
                 doc.close()
@@ -344,8 +501,16 @@ def process_pdf(pdf_file_path: str, csv_writer: csv.DictWriter,
                 logging.critical(f"PDF 파일 닫기 실패 - {doc_id}: {str(e)}")
 
 
+def init_worker() -> None:
+    """워커 프로세스 초기화 함수 (fitz 워닝 및 MuPDF 에러 메시지 출력 억제)"""
+    warnings.filterwarnings('ignore', category=RuntimeWarning)
+    fitz.TOOLS.mupdf_display_errors(False)
+
+
 def process_pdf_folder(folder_path: str, output_csv: str, min_raw_length: int = 35, min_cleaned_length: int = 20) -> None:
-    """폴더 내 PDF 파일을 일괄 처리하여 문장을 CSV에 기록
+    """폴더 내 PDF 파일을 여러 프로세스로 병렬 처리하여 문장을 CSV에 기록
+    
+    각 PDF 파일은 워커 프로세스에서 처리되고, CSV 기록은 메인 프로세스에서만 수행합니다.
     
     Args:
         folder_path (str): PDF 파일이 있는 폴더 경로
@@ -364,38 +529,56 @@ def process_pdf_folder(folder_path: str, output_csv: str, min_raw_length: int =
     # 제외된 문서 정보를 저장할 파일 경로
     excluded_csv = os.path.join(output_dir, '제외 문서.csv')
     
-    pdf_files = [f for f in os.listdir(folder_path) if f.lower().endswith('.pdf')]
+    # DirEntry가 디렉터리 읽기 시 얻은 파일 정보와 전체 경로를 재사용 (.pdf 이름의 폴더는 제외)
+    with os.scandir(folder_path) as entries:
+        pdf_files = [entry for entry in entries if entry.is_file() and entry.name.lower().endswith('.pdf')]
     if not pdf_files:
         logging.critical(f"경고: {folder_path}에서 PDF 파일을 찾을 수 없습니다.")
         return
     
     processed_docs = 0
     excluded_docs = 0
+    max_workers = min(os.cpu_count() or 1, MAX_WORKERS)
     
     try:
-        with open(output_csv, 'w', newline='', encoding='utf-8-sig') as csvfile, \
+        with open(output_csv, 'w', newline='', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as csvfile, \
              open(excluded_csv, 'w', newline='', encoding='utf-8-sig') as excluded_file:
             
             # 메인 CSV 작성기 설정
             fieldnames = ['doc_id', 'type', 'page_no', 'sentence_no', 'original', 'content']
-            csv_writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            csv_writer.writeheader()
+            csv_writer = csv.writer(csvfile)
+            csv_writer.writerow(fieldnames)
             
             # 제외된 문서 정보 CSV 작성기 설정
             excluded_fieldnames = ['doc_id', 'reason', 'error']
             excluded_writer = csv.DictWriter(excluded_file, fieldnames=excluded_fieldnames)
             excluded_writer.writeheader()
             
-            with tqdm.tqdm(total=len(pdf_files), desc="전체 진행률", unit="%") as pbar:
-                for filename in pdf_files:
-                    pdf_file_path = os.path.join(folder_path, filename)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor, \
+                 tqdm.tqdm(total=len(pdf_files), desc="전체 진행률", unit="%") as pbar:
+                # 제너레이터를 진행할 때마다 파일 하나를 제출 (한 번에 전체를 제출하지 않음)
+                tasks = (
+                    (entry, executor.submit(process_pdf, entry.path, min_raw_length, min_cleaned_length))
+                    for entry in pdf_files
+                )
+                pending = deque(itertools.islice(tasks, max_workers * PENDING_PER_WORKER))
+                # 파일 순서대로 결과를 받아 기록 (한 파일의 실패가 다른 파일 결과에 영향을 주지 않도록 개별 처리)
+                # 기록한 future는 큐에서 꺼내 버리고 다음 파일을 제출하여, 앞 파일이 늦어져도
+                # 메모리에 남는 문서 결과는 제출해 둔 파일 수 이하로 유지
+                while pending:
+                    entry, future = pending.popleft()
+                    pending.extend(itertools.islice(tasks, 1))
                     try:
-                        if process_pdf(pdf_file_path, csv_writer, excluded_writer, min_raw_length, min_cleaned_length):
+                        doc_id, rows, excluded = future.result()
+                        if excluded is None:
+                            # 문서 단위로 모아서 한 번에 기록
+                            csv_writer.writerows(rows)
                             processed_docs += 1
                         else:
+                            write_excluded_doc(excluded_writer, doc_id, *excluded)
                             excluded_docs += 1
                     except Exception as e:
-                        logging.critical(f"파일 처리 실패 - {filename}: {str(e)}")
+                        logging.critical(f"파일 처리 실패 - {entry.name}: {str(e)}")
                         excluded_docs += 1
                     finally:
                         pbar.update(1)
@@ -421,33 +604,17 @@ def preprocess_text(text: str) -> str:
     if not text:
         return text
         
-    # 특수 패턴을 처리하기 전에 줄바꿈을 임시 마커로 변경
-    text = text.replace('\n', ' LINEBREAK ')
-    
-    # 단어 연결 패턴 정의
-    word_patterns = [
-        # 하이픈으로 분리된 단어
-        (r'(\w+)-\s*LINEBREAK\s*(\w+)', r'\1\2'),
-        # Ž 패턴으로 분리된 단어 (마침표 포함/미포함)
-        (r'(\w+)\s*Ž\s*\.?\s*(\w+)', r'\1\2'),
-        # 마침표로 분리된 단어
-        (r'(\w+)\s*\.\s*\.\s*(\w+)', r'\1\2'),
-        # 마침표와 공백으로 잘못 분리된 단어
-        (r'(\w+)\s+\.\s+(\w+)', r'\1 \2'),
-        # 마침표와 공백으로 잘못 분리된 단어 (소문자로 시작하는 경우)
-        (r'(\w+)\s*\.\s+([a-z]\w*)', r'\1 \2'),
-    ]
-    
-    # 모든 패턴 적용
-    for pattern, replacement in word_patterns:
-        text = re.sub(pattern, replacement, text)
+    # 줄바꿈 앞뒤에 공백을 두어 단어 연결 패턴에서 독립된 단어로 취급되도록 함
+    # (줄바꿈은 마지막 공백 정리에서 함께 제거되므로 별도의 복원 과정이 필요 없음)
+    text = text.replace('\n', ' \n ')
     
-    # 줄바꿈 마커를 다시 공백으로 변환
-    text = text.replace('LINEBREAK', ' ')
+    # 모든 단어 연결 패턴 적용
+    for pattern, replacement in _WORD_JOIN_PATTERNS:
+        text = pattern.sub(replacement, text)
     
     # 문장 정리
-    text = re.sub(r'\s+', ' ', text)  # 연속된 공백을 하나로
-    text = re.sub(r'\s*([,.])\s*', r'\1 ', text)  # 구두점 주변 공백 정리
+    text = _WS.sub(' ', text)  # 줄바꿈을 포함한 연속된 공백을 하나로
+    text = _PUNCT_SPACING.sub(r'\1 ', text)  # 구두점 주변 공백 정리
     
     return text.strip()
 